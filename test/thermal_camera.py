@@ -13,9 +13,77 @@ import numpy as np
 import cv2
 import time
 import os
+import threading
 from ctypes import POINTER, Structure, c_void_p, c_int, c_uint, c_uint8, c_uint16, c_uint32, c_double
 
 
+# Y14 -> 摄氏度 换算常量: 摄氏度 = Y14 / 64 - 273.15
+Y14_SCALE = 1.0 / 64.0
+KELVIN_OFFSET = 273.15
+
+# 显示放大倍数 (192x256 -> 576x768)
+DISPLAY_SCALE = 3
+
+# 设置环境变量 THERMAL_USE_OPENCL=1 时，上色和放大走 OpenCL (UMat) 路径。
+# 默认关闭：小尺寸帧的预分配 CPU 路径已足够快，而仅有 CPU OpenCL 运行时
+# （如 PoCL）的机器上 UMat 路径每帧还要分配并下载整幅显示图像
+USE_OPENCL = os.environ.get("THERMAL_USE_OPENCL", "0") == "1"
+
+# 非阻塞按键查询（OpenCV >= 4.5.3 提供 pollKey，旧版本退回 waitKey(1)）
+poll_key = getattr(cv2, "pollKey", lambda: cv2.waitKey(1))
+
+# 信息面板半透明背景区域（左上角 / 右下角，含端点）
+PANEL_X0, PANEL_Y0 = 5, 5
+PANEL_X1, PANEL_Y1 = 280, 220
+
+
+def fuse_y14(frame_u16, out_u8, lo=None, scale=None, with_stats=True):
+    """
+    一次完成 Y14 温度帧的统计与 8 位灰度量化
+    
+    Y14 -> 摄氏度是线性变换，统计量与归一化都直接在原始 uint16 数据上完成，
+    只把最终的几个标量换算为摄氏度，无需生成整帧 float32 摄氏度数组。
+    每一步都是 OpenCV 的单遍 C 内核：
+    - minMaxLoc: 最小值/最大值
+    - meanStdDev: 一遍同时累加 sum 与 sumsq，得到平均值和标准差
+    - addWeighted: Y14 线性拉伸 + 饱和截断 + uint8 量化，直接写入 out_u8
+    
+    参数:
+        frame_u16: Y14 格式的温度帧（uint16）
+        out_u8: 预分配的灰度输出缓冲区（uint8，与 frame_u16 同尺寸）
+        lo: 显示范围下限（Y14 原始值），None 表示使用本帧范围
+        scale: 映射系数 255 / (上限 - 下限)（Y14 原始值），与 lo 一同给出
+        with_stats: 是否计算统计量；为 False 时跳过 meanStdDev，
+                    给出了 lo / scale 时连 minMaxLoc 也跳过
+        
+    返回:
+        tuple: (min, max, mean, std, gray)，温度单位为摄氏度，未计算的统计量为 None
+    """
+    min_temp = max_temp = mean_temp = std_temp = None
+    
+    # 没有消费者的统计量不计算
+    if with_stats or lo is None:
+        raw_min, raw_max, _, _ = cv2.minMaxLoc(frame_u16)
+        min_temp = raw_min * Y14_SCALE - KELVIN_OFFSET
+        max_temp = raw_max * Y14_SCALE - KELVIN_OFFSET
+    if with_stats:
+        raw_mean, raw_std = cv2.meanStdDev(frame_u16)
+        mean_temp = raw_mean[0, 0] * Y14_SCALE - KELVIN_OFFSET
+        std_temp = raw_std[0, 0] * Y14_SCALE
+    
+    # 显示归一化直接在 Y14 原始值上进行：摄氏度换算的缩放与偏移
+    # 在 min-max 重映射中相互抵消
+    if lo is None:
+        lo = raw_min
+        scale = 255.0 / max(1.0, raw_max - raw_min)
+    
+    # gray = (Y14 - lo) * scale，两个标量作为常量传入单遍内核
+    # addWeighted 输出 CV_8U 时自带饱和截断，等价于 clip(0, 255)
+    cv2.addWeighted(frame_u16, scale, frame_u16, 0.0, -lo * scale, out_u8, cv2.CV_8U)
+    
+    return min_temp, max_temp, mean_temp, std_temp, out_u8
+
+
 # ============================================================
 # 第一部分：底层 C 库接口封装
 # ============================================================
@@ -68,6 +136,22 @@ class ThermalCameraSDK:
         self.lib = ctypes.CDLL(sdk_path)
         self.camera_handle = None
         
+        # 温度帧尺寸与缓冲区（在 open_camera 时确定，之后每帧复用）
+        self.temp_width = 0
+        self.temp_height = 0
+        self._temp_size = 0
+        self._temp_buf = None
+        self._temp_view = None
+        self._temp_addr = None
+        
+        # 查询尺寸/信息用的 ctypes 输出参数，创建一次后重复使用
+        self._w = c_uint32()
+        self._h = c_uint32()
+        self._fps = c_uint32()
+        self._w_ref = ctypes.byref(self._w)
+        self._h_ref = ctypes.byref(self._h)
+        self._fps_ref = ctypes.byref(self._fps)
+        
         # 设置函数接口
         self._setup_functions()
         
@@ -101,8 +185,9 @@ class ThermalCameraSDK:
         self.lib.simple_camera_get_frame.argtypes = [c_void_p, c_uint32]
         self.lib.simple_camera_get_frame.restype = c_int
         
+        # 返回裸地址（int），便于判断 SDK 缓冲区是否发生变化
         self.lib.simple_camera_get_temp_data.argtypes = [c_void_p]
-        self.lib.simple_camera_get_temp_data.restype = POINTER(c_uint16)
+        self.lib.simple_camera_get_temp_data.restype = c_void_p
         
         self.lib.simple_camera_get_temp_size.argtypes = [c_void_p, POINTER(c_uint32), POINTER(c_uint32)]
         self.lib.simple_camera_get_temp_size.restype = c_int
@@ -130,15 +215,20 @@ class ThermalCameraSDK:
             return False
         
         # 获取相机信息
-        width = c_uint32()
-        height = c_uint32()
-        fps = c_uint32()
-        self.lib.simple_camera_get_info(self.camera_handle, 
-                                       ctypes.byref(width),
-                                       ctypes.byref(height),
-                                       ctypes.byref(fps))
-        
-        print(f"✓ 相机打开成功: {width.value}x{height.value} @ {fps.value}fps")
+        self.lib.simple_camera_get_info(self.camera_handle,
+                                       self._w_ref, self._h_ref, self._fps_ref)
+        width, height, fps = self._w.value, self._h.value, self._fps.value
+        
+        # 温度帧尺寸在相机打开后即固定，只查询一次并预分配目标缓冲区
+        self.lib.simple_camera_get_temp_size(self.camera_handle, self._w_ref, self._h_ref)
+        self.temp_width = self._w.value
+        self.temp_height = self._h.value
+        self._temp_size = self.temp_width * self.temp_height
+        self._temp_buf = np.empty((self.temp_height, self.temp_width), dtype=np.uint16)
+        self._temp_view = None
+        self._temp_addr = None
+        
+        print(f"✓ 相机打开成功: {width}x{height} @ {fps}fps")
         return True
     
     def close_camera(self):
@@ -173,12 +263,15 @@ class ThermalCameraSDK:
             self.lib.simple_camera_stop_stream(self.camera_handle)
             print("✓ 流传输已停止")
     
-    def get_temperature_frame(self):
+    def get_temperature_frame_view(self):
         """
-        获取一帧温度数据
+        获取一帧温度数据的只读视图（不拷贝）
+        
+        注意：返回的数组直接指向 SDK 内部缓冲区，只在下一次取帧之前有效，
+        需要保留数据时请拷贝到自己的缓冲区（例如 np.copyto）
         
         返回:
-            numpy.ndarray: 温度帧数据（Y14格式），shape=(192, 256), dtype=uint16
+            numpy.ndarray: 温度帧数据（Y14格式），shape=(192, 256), dtype=uint16，只读
             None: 获取失败
         """
         if not self.camera_handle:
@@ -189,24 +282,45 @@ class ThermalCameraSDK:
         if ret < 0:
             return None
         
-        # 获取温度帧尺寸
-        width = c_uint32()
-        height = c_uint32()
-        self.lib.simple_camera_get_temp_size(self.camera_handle,
-                                            ctypes.byref(width),
-                                            ctypes.byref(height))
+        # 获取温度数据地址
+        data_addr = self.lib.simple_camera_get_temp_data(self.camera_handle)
+        if not data_addr:
+            return None
+        
+        # 仅当 SDK 缓冲区地址变化时才重建 numpy 视图
+        if data_addr != self._temp_addr:
+            c_array = (c_uint16 * self._temp_size).from_address(data_addr)
+            self._temp_view = np.frombuffer(c_array, dtype=np.uint16).reshape(
+                (self.temp_height, self.temp_width))
+            self._temp_view.setflags(write=False)
+            self._temp_addr = data_addr
+        
+        return self._temp_view
+    
+    def get_temperature_frame(self, out=None):
+        """
+        获取一帧温度数据
+        
+        注意：未指定 out 时返回的数组是预分配的内部缓冲区，下一次调用时会被覆盖，
+        如需长期保存请自行 copy()
         
-        # 获取温度数据指针
-        data_ptr = self.lib.simple_camera_get_temp_data(self.camera_handle)
-        if not data_ptr:
+        参数:
+            out: 可选的目标缓冲区（uint16，shape 与温度帧一致），帧数据直接拷贝到此处
+            
+        返回:
+            numpy.ndarray: 温度帧数据（Y14格式），shape=(192, 256), dtype=uint16
+            None: 获取失败
+        """
+        view = self.get_temperature_frame_view()
+        if view is None:
             return None
         
-        # 转换为 numpy 数组
-        size = width.value * height.value
-        temp_array = np.ctypeslib.as_array(data_ptr, shape=(size,))
-        temp_frame = temp_array.reshape((height.value, width.value)).copy()
+        # 单次 memcpy 拷贝到固定缓冲区
+        if out is None:
+            out = self._temp_buf
+        np.copyto(out, view)
         
-        return temp_frame
+        return out
     
     @staticmethod
     def y14_to_celsius(y14_value):
@@ -223,20 +337,23 @@ class ThermalCameraSDK:
         返回:
             float: 摄氏度温度
         """
-        return (float(y14_value) / 64.0) - 273.15
+        return y14_value * Y14_SCALE - KELVIN_OFFSET
     
     @staticmethod
-    def y14_frame_to_celsius(y14_frame):
+    def y14_frame_to_celsius(y14_frame, out=None):
         """
         将整帧 Y14 数据转换为摄氏度
         
         参数:
             y14_frame: Y14 格式的温度帧（numpy数组）
+            out: 可选的预分配输出缓冲区（float32，与 y14_frame 同尺寸）
             
         返回:
             numpy.ndarray: 摄氏度温度帧
         """
-        return (y14_frame.astype(np.float32) / 64.0) - 273.15
+        out = np.multiply(y14_frame, np.float32(Y14_SCALE), out=out, dtype=np.float32)
+        out -= np.float32(KELVIN_OFFSET)
+        return out
 
 
 # ============================================================
@@ -277,10 +394,39 @@ class ThermalCameraApp:
         self.show_crosshair = True  # 显示十字准星
         self.show_stats = True      # 显示统计信息
         
+        # 显式开启且有 OpenCL 设备时，上色和放大通过 UMat 交给 GPU 完成
+        self.use_opencl = USE_OPENCL and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        
+        # 伪彩色查找表 (256x3 BGR) 及其水平放大版本 (256x(3*DISPLAY_SCALE))，
+        # 切换伪彩色方案时更新
+        self._lut = None
+        self._lut_wide = None
+        self._lut_cache = {}
+        self._colormap_dirty = True
+        
+        # 预分配的灰度/彩色/显示帧缓冲区与中心点坐标（相机打开后按温度帧尺寸确定）
+        self._gray_out = None
+        self._colored_wide = None
+        self._display = None
+        self._cx = 0
+        self._cy = 0
+        
+        # 采集线程与帧缓冲区（后台 / 就绪 / 前台 三个槽位轮换）
+        self._capture_thread = None
+        self._stop_event = threading.Event()
+        self._frame_ready = threading.Event()
+        self._buf_lock = threading.Lock()
+        self._buf = None
+        self._capture_error = None
+        self._back, self._ready, self._front = 0, 1, 2
+        
         # 性能统计
         self.frame_count = 0
         self.start_time = time.time()
-        self.fps = 0.0
+        self.fps = 0.0              # 信息面板显示的瞬时帧率（指数滑动平均）
+        self._last_ts = None
     
     def initialize(self):
         """
@@ -302,6 +448,14 @@ class ThermalCameraApp:
             if not self.sdk.open_camera():
                 return False
             
+            h, w = self.sdk.temp_height, self.sdk.temp_width
+            self._gray_out = np.empty((h, w), dtype=np.uint8)
+            self._colored_wide = np.empty((h, w * DISPLAY_SCALE * 3), dtype=np.uint8)
+            self._display = np.empty((h * DISPLAY_SCALE, w * DISPLAY_SCALE, 3),
+                                     dtype=np.uint8)
+            self._cx = w // 2
+            self._cy = h // 2
+            
             # 开始流传输
             if not self.sdk.start_stream():
                 self.sdk.close_camera()
@@ -315,14 +469,82 @@ class ThermalCameraApp:
             traceback.print_exc()
             return False
     
+    def _start_capture(self):
+        """
+        启动采集线程
+        
+        采集（USB/UVC 取帧）在后台线程进行，与主线程的处理和显示重叠，
+        USB 传输抖动不再直接卡住显示
+        """
+        shape = (self.sdk.temp_height, self.sdk.temp_width)
+        self._buf = [np.empty(shape, dtype=np.uint16) for _ in range(3)]
+        self._back, self._ready, self._front = 0, 1, 2
+        self._stop_event.clear()
+        self._frame_ready.clear()
+        self._capture_error = None
+        
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+    
+    def _stop_capture(self):
+        """停止采集线程"""
+        if self._capture_thread:
+            self._stop_event.set()
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
+    
+    def _capture_loop(self):
+        """
+        采集线程主循环
+        
+        每帧写入后台槽位，写完后与就绪槽位交换并通知主线程。
+        锁覆盖槽位交换和通知（不覆盖帧拷贝），保证主线程看到的通知与就绪槽位一致，
+        主线程正在读的前台槽位永远不会被写入。
+        取帧出错时记录异常并退出线程，由主循环检测后结束程序
+        """
+        try:
+            while not self._stop_event.is_set():
+                # 直接从 SDK 缓冲区视图拷贝到后台槽位，整条链路只有这一次拷贝
+                view = self.sdk.get_temperature_frame_view()
+                if view is None:
+                    continue
+                np.copyto(self._buf[self._back], view)
+                
+                with self._buf_lock:
+                    self._back, self._ready = self._ready, self._back
+                    self._frame_ready.set()
+        except Exception as e:
+            print(f"\n✗ 采集线程出错: {e}")
+            import traceback
+            traceback.print_exc()
+            self._capture_error = e
+    
+    def _latest_frame(self, timeout=1.0):
+        """
+        取出最新的完整温度帧
+        
+        参数:
+            timeout: 等待新帧的超时时间（秒）
+            
+        返回:
+            numpy.ndarray: 最新温度帧，在下一次调用前保持有效
+            None: 超时未收到新帧
+        """
+        if not self._frame_ready.wait(timeout):
+            return None
+        
+        with self._buf_lock:
+            self._frame_ready.clear()
+            self._front, self._ready = self._ready, self._front
+        
+        return self._buf[self._front]
+    
     def process_frame(self, y14_frame):
         """
         处理温度帧，生成可视化图像
         
         处理步骤：
-        1. 将 Y14 格式转换为摄氏度
-        2. 计算温度统计信息（最小值、最大值、平均值）
-        3. 归一化到 0-255 范围
+        1-3. 计算温度统计信息并归一化到 0-255 范围（fuse_y14 一次完成）
         4. 应用伪彩色映射
         5. 放大图像以便观看
         6. 添加十字准星和信息叠加
@@ -333,37 +555,55 @@ class ThermalCameraApp:
         返回:
             numpy.ndarray: BGR 格式的可视化图像
         """
-        # 步骤1: 转换为摄氏度
-        celsius_frame = self.sdk.y14_frame_to_celsius(y14_frame)
-        
-        # 步骤2: 计算温度统计
-        min_temp = np.min(celsius_frame)
-        max_temp = np.max(celsius_frame)
-        mean_temp = np.mean(celsius_frame)
-        std_temp = np.std(celsius_frame)
+        # 步骤1-3: 温度统计 + 归一化 + 量化（不生成整帧摄氏度数组）
+        # 固定范围时在这里把摄氏度端点换算为 Y14 的 lo / scale，自动范围交给内核
+        if self.auto_range:
+            lo = scale = None
+        else:
+            lo = (self.min_temp + KELVIN_OFFSET) / Y14_SCALE
+            scale = 255.0 * Y14_SCALE / max(Y14_SCALE, self.max_temp - self.min_temp)
+        # 统计量只在信息面板显示时才需要（自动范围所需的最小/最大值由内核自行计算）
+        min_temp, max_temp, mean_temp, std_temp, gray = fuse_y14(
+            y14_frame, self._gray_out, lo, scale, with_stats=self.show_stats)
         
         # 自动调整显示范围
         if self.auto_range:
             self.min_temp = min_temp
             self.max_temp = max_temp
         
-        # 步骤3: 归一化（将温度值映射到 0-255）
-        normalized = np.clip(
-            (celsius_frame - self.min_temp) / (self.max_temp - self.min_temp + 1e-6),
-            0, 1
-        )
-        gray = (normalized * 255).astype(np.uint8)
-        
-        # 步骤4: 应用伪彩色
-        colored = cv2.applyColorMap(gray, self.colormap)
-        
-        # 步骤5: 放大图像 (192x256 -> 576x768)
-        display = cv2.resize(colored, (768, 576), interpolation=cv2.INTER_NEAREST)
+        # 步骤4-5: 查表上色并整数倍放大 (192x256 -> 576x768)
+        # 查找表只在切换伪彩色方案后更新，并按方案缓存，切回时无需重建
+        if self._colormap_dirty:
+            luts = self._lut_cache.get(self.colormap)
+            if luts is None:
+                lut = cv2.applyColorMap(
+                    np.arange(256, dtype=np.uint8).reshape(1, 256), self.colormap).reshape(256, 3)
+                luts = (lut, np.ascontiguousarray(np.tile(lut, (1, DISPLAY_SCALE))))
+                self._lut_cache[self.colormap] = luts
+            self._lut, self._lut_wide = luts
+            self._colormap_dirty = False
+        
+        h, w = gray.shape
+        if self.use_opencl:
+            # OpenCL 路径：只上传小尺寸灰度帧，放大后的结果下载一次
+            gray_u = cv2.cvtColor(cv2.UMat(gray), cv2.COLOR_GRAY2BGR)
+            colored_u = cv2.LUT(gray_u, self._lut.reshape(1, 256, 3))
+            display = cv2.resize(colored_u, (w * DISPLAY_SCALE, h * DISPLAY_SCALE),
+                                 interpolation=cv2.INTER_NEAREST).get()
+        else:
+            # 最近邻放大只是把每个像素复制成 3x3 块：
+            # 查表时直接取出水平重复 3 次的颜色，得到放大后的一行；
+            # 再把每行整行复制 3 次（连续内存拷贝）写入预分配的显示缓冲区
+            np.take(self._lut_wide, gray, axis=0,
+                    out=self._colored_wide.reshape(h, w, DISPLAY_SCALE * 3), mode='clip')
+            np.copyto(self._display.reshape(h, DISPLAY_SCALE, w * DISPLAY_SCALE * 3),
+                      self._colored_wide[:, None, :])
+            display = self._display
         
         # 步骤6: 添加十字准星
         if self.show_crosshair:
-            h, w = display.shape[:2]
-            center_x, center_y = w // 2, h // 2
+            center_x = self._cx * DISPLAY_SCALE
+            center_y = self._cy * DISPLAY_SCALE
             
             # 画十字线
             cv2.line(display, (center_x - 30, center_y), (center_x + 30, center_y), 
@@ -372,8 +612,7 @@ class ThermalCameraApp:
                     (0, 255, 0), 2)
             
             # 显示中心点温度
-            orig_h, orig_w = celsius_frame.shape
-            center_temp = celsius_frame[orig_h // 2, orig_w // 2]
+            center_temp = float(y14_frame[self._cy, self._cx]) * Y14_SCALE - KELVIN_OFFSET
             cv2.putText(display, f"{center_temp:.1f}C", 
                        (center_x + 35, center_y + 5),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
@@ -397,15 +636,18 @@ class ThermalCameraApp:
             image: 要绘制的图像
             stats: 温度统计信息字典
         """
-        # 创建半透明背景
-        overlay = image.copy()
-        cv2.rectangle(overlay, (5, 5), (280, 220), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, image, 0.3, 0, image)
-        
-        # 计算帧率
-        elapsed = time.time() - self.start_time
-        if elapsed > 0:
-            self.fps = self.frame_count / elapsed
+        # 半透明背景只作用于面板区域
+        # 与黑色按 0.7/0.3 混合等价于把原像素乘以 0.3，无需读取黑色底图
+        roi = image[PANEL_Y0:PANEL_Y1 + 1, PANEL_X0:PANEL_X1 + 1]
+        cv2.convertScaleAbs(roi, roi, 0.3)
+        
+        # 计算帧率：对相邻两次绘制的间隔做指数滑动平均，能及时反映 USB 抖动
+        now = time.perf_counter()
+        if self._last_ts is not None:
+            dt = now - self._last_ts
+            if dt > 0:
+                self.fps = 1.0 / dt if self.fps == 0.0 else 0.9 * self.fps + 0.1 / dt
+        self._last_ts = now
         
         # 准备显示文本
         info_lines = [
@@ -424,11 +666,12 @@ class ThermalCameraApp:
             f"FPS: {self.fps:.1f}",
         ]
         
-        # 绘制文本
+        # 绘制文本（直接在变暗的背景上抗锯齿绘制，边缘与背景正确混合）
         y = 25
         for line in info_lines:
-            cv2.putText(image, line, (10, y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 0), 1, cv2.LINE_AA)
+            if line:
+                cv2.putText(image, line, (10, y), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 0), 1, cv2.LINE_AA)
             y += 20 if line and line != "=" * 25 else 10
     
     def run(self):
@@ -458,23 +701,41 @@ class ThermalCameraApp:
         cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
         cv2.resizeWindow(window_name, 768, 576)
         
+        # 启动后台采集
+        self._start_capture()
+        
+        # 等待新帧的超时时间，以及无新帧时显示一个进度点所需的连续超时次数（约 1 秒）
+        frame_timeout = 0.1
+        stall_dot_count = 10
+        stall_count = 0
+        
         try:
             # 主循环
             while True:
-                # 获取一帧温度数据
-                temp_frame = self.sdk.get_temperature_frame()
-                if temp_frame is None:
-                    print(".", end="", flush=True)  # 显示进度点
-                    continue
-                
-                # 处理并显示
-                display_image = self.process_frame(temp_frame)
-                cv2.imshow(window_name, display_image)
-                
-                self.frame_count += 1
+                # 获取最新一帧温度数据
+                temp_frame = self._latest_frame(frame_timeout)
                 
-                # 处理键盘输入
-                key = cv2.waitKey(1) & 0xFF
+                if temp_frame is None:
+                    if self._capture_error is not None:
+                        print("✗ 采集线程已停止，程序退出")
+                        break
+                    
+                    # 没有新帧（USB 卡顿）：不重绘画面，只非阻塞地处理窗口事件和按键
+                    stall_count += 1
+                    if stall_count % stall_dot_count == 0:
+                        print(".", end="", flush=True)  # 显示进度点
+                    key = poll_key() & 0xFF
+                else:
+                    stall_count = 0
+                    
+                    # 处理并显示
+                    display_image = self.process_frame(temp_frame)
+                    cv2.imshow(window_name, display_image)
+                    
+                    self.frame_count += 1
+                    
+                    # 处理键盘输入
+                    key = cv2.waitKey(1) & 0xFF
                 
                 if key == ord('q') or key == 27:  # Q 或 ESC
                     print("\n✓ 用户退出")
@@ -482,22 +743,27 @@ class ThermalCameraApp:
                     
                 elif key == ord('1'):
                     self.colormap = cv2.COLORMAP_JET
+                    self._colormap_dirty = True
                     print(f"✓ Colormap: {self.colormap_names[self.colormap]}")
                     
                 elif key == ord('2'):
                     self.colormap = cv2.COLORMAP_HOT
+                    self._colormap_dirty = True
                     print(f"✓ Colormap: {self.colormap_names[self.colormap]}")
                     
                 elif key == ord('3'):
                     self.colormap = cv2.COLORMAP_RAINBOW
+                    self._colormap_dirty = True
                     print(f"✓ Colormap: {self.colormap_names[self.colormap]}")
                     
                 elif key == ord('4'):
                     self.colormap = cv2.COLORMAP_COOL
+                    self._colormap_dirty = True
                     print(f"✓ Colormap: {self.colormap_names[self.colormap]}")
                     
                 elif key == ord('5'):
                     self.colormap = cv2.COLORMAP_BONE
+                    self._colormap_dirty = True
                     print(f"✓ Colormap: {self.colormap_names[self.colormap]}")
                     
                 elif key == ord('a') or key == ord('A'):
@@ -512,6 +778,9 @@ class ThermalCameraApp:
                     
                 elif key == ord('s') or key == ord('S'):
                     self.show_stats = not self.show_stats
+                    # 面板隐藏期间不计帧间隔，重新显示时与启动时一样重新开始测量
+                    self._last_ts = None
+                    self.fps = 0.0
                     status = "ON" if self.show_stats else "OFF"
                     print(f"✓ Statistics: {status}")
         
@@ -525,6 +794,7 @@ class ThermalCameraApp:
             
         finally:
             # 清理资源
+            self._stop_capture()
             cv2.destroyAllWindows()
             if self.sdk:
                 self.sdk.stop_stream()
@@ -532,10 +802,11 @@ class ThermalCameraApp:
             
             # 显示统计信息
             elapsed = time.time() - self.start_time
+            avg_fps = self.frame_count / elapsed if elapsed > 0 else 0.0
             print(f"\n程序运行统计:")
             print(f"  总帧数: {self.frame_count}")
             print(f"  运行时间: {elapsed:.1f} 秒")
-            print(f"  平均帧率: {self.fps:.1f} FPS")
+            print(f"  平均帧率: {avg_fps:.1f} FPS")
             print("\n" + "=" * 60)
         
         return 0
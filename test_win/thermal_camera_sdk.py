@@ -11,13 +11,16 @@
 功能：
 - 相机初始化和管理
 - 自动选择 256x384 分辨率
-- 数据分离（raw_data_cut）
+- 数据分离（NumPy 切片，可回退到 raw_data_cut）
 - 温度转换
 - 帧获取和处理
 """
 
 import os
 import sys
+import mmap
+import time
+import threading
 from ctypes import *
 import numpy as np
 
@@ -38,6 +41,10 @@ RESOLUTION_384 = (256, 384)   # 组合模式（图像+温度）
 DEFAULT_FPS = 25
 DEFAULT_TIMEOUT = 2000
 
+# 温度换算: 摄氏度 = raw / 64 - 273.15
+TEMP_SCALE = 1.0 / 64.0
+TEMP_OFFSET = 273.15
+
 
 # ========================================================================
 # C 结构体定义
@@ -95,17 +102,20 @@ def temp_value_converter(temp_val):
     return (float(temp_val) / 64.0 - 273.15)
 
 
-def temp_array_converter(temp_array):
+def temp_array_converter(temp_array, out=None):
     """
     批量转换温度数组（使用 NumPy 向量化操作）
     
     参数:
         temp_array: np.ndarray (uint16) 原始温度数据
+        out: 可选的预分配输出数组 (float32，与 temp_array 同尺寸)，结果直接写入
     
     返回:
         np.ndarray (float32): 摄氏度温度数据
     """
-    return (temp_array.astype(np.float32) / 64.0 - 273.15)
+    out = np.multiply(temp_array, np.float32(TEMP_SCALE), out=out, dtype=np.float32)
+    out -= np.float32(TEMP_OFFSET)
+    return out
 
 
 # ========================================================================
@@ -163,6 +173,35 @@ class ThermalCameraSDK:
         self.image_buffer = None
         self.temp_buffer = None
         
+        # 384 模式下是否调用 libirparse.raw_data_cut 分离数据
+        # （默认直接对原始帧做 NumPy 切片，省去一次整帧拷贝）
+        self._use_dll_cut = False
+        
+        # 是否每帧生成整幅摄氏度数组（start_stream 设置）
+        self._convert_celsius = True
+        
+        # 缓冲区上的 NumPy 视图与摄氏度输出缓冲区（start_stream 时创建，每帧复用）
+        self._temp_view = None
+        self._image_view = None
+        self._celsius_buf = None
+        
+        # 后台采集线程与帧槽位（后台 / 就绪 / 前台 三个槽位轮换）
+        self._capture_thread = None
+        self._stop_event = threading.Event()
+        self._frame_ready = threading.Event()
+        self._slot_lock = threading.Lock()
+        self._capture_error = None
+        self._sync_slot = None
+        self._slots = None
+        
+        # 帧槽位池：按 (尺寸, 模式) 缓存 stop_stream 归还的槽位，重新 start_stream 时复用
+        self._slot_pool = {}
+        self._back, self._ready, self._front = 0, 1, 2
+        
+        # 热路径上的 DLL 函数引用（start_stream 中缓存）
+        self._uvc_frame_get = None
+        self._raw_data_cut = None
+        
         # 统计信息
         self.frame_count = 0
         self.version_info = {}
@@ -176,6 +215,9 @@ class ThermalCameraSDK:
             self.libirparse = CDLL(os.path.join(self.sdk_path, 'libirparse.dll'))
             
             # 设置函数签名 - libiruvc
+            # 注意：CDLL（而非 PyDLL）在外部函数调用期间会释放 GIL，热路径上的
+            # uvc_frame_get / raw_data_cut 参数均为指针和整数，无需持有 GIL 做对象转换，
+            # 后台采集线程阻塞在 USB 传输上时不会影响主线程
             self.libiruvc.iruvc_version_number.argtypes = []
             self.libiruvc.iruvc_version_number.restype = c_char_p
             
@@ -259,15 +301,19 @@ class ThermalCameraSDK:
             raise RuntimeError(f"列出设备失败 (ret={ret})")
         
         devices = []
-        for i in range(64):
-            if devs_cfg[i].vid == 0 and devs_cfg[i].pid == 0:
+        for i, dev in enumerate(devs_cfg):
+            # 每个字段只读取一次，避免重复的 ctypes 属性访问
+            vid = dev.vid
+            pid = dev.pid
+            if vid == 0 and pid == 0:
                 break
             
+            name = dev.name
             device_info = {
                 'index': i,
-                'vid': devs_cfg[i].vid,
-                'pid': devs_cfg[i].pid,
-                'name': devs_cfg[i].name.decode() if devs_cfg[i].name else 'Unknown'
+                'vid': vid,
+                'pid': pid,
+                'name': name.decode() if name else 'Unknown'
             }
             devices.append(device_info)
         
@@ -295,65 +341,70 @@ class ThermalCameraSDK:
         if ret < 0:
             raise RuntimeError(f"列出设备失败 (ret={ret})")
         
-        # 查找目标设备
-        found_dev_index = -1
-        for i in range(64):
-            if devs_cfg[i].vid == CAMERA_VID and devs_cfg[i].pid == CAMERA_PID:
-                found_dev_index = i
+        # 查找目标设备（遇到空条目即停止扫描）
+        dev_cfg = None
+        for dev in devs_cfg:
+            vid = dev.vid
+            pid = dev.pid
+            if vid == CAMERA_VID and pid == CAMERA_PID:
+                dev_cfg = dev
+                break
+            if vid == 0 and pid == 0:
                 break
         
-        if found_dev_index < 0:
+        if dev_cfg is None:
             raise RuntimeError("未找到红外相机设备")
         
         # 获取流信息
         camera_stream_info = (CameraStreamInfo * 32)()
         ret = self.libiruvc.uvc_camera_info_get(
-            devs_cfg[found_dev_index], 
+            dev_cfg, 
             camera_stream_info
         )
         if ret < 0:
             raise RuntimeError(f"获取相机流信息失败 (ret={ret})")
         
-        # 列出所有支持的分辨率
+        # 列出所有支持的分辨率，同时建立 (宽, 高) -> 索引 的查找表
         resolutions = []
-        stream_idx = -1
+        stream_index = {}
         target_height = 384 if use_384_mode else 192
         
-        for i in range(32):
-            if camera_stream_info[i].width == 0:
+        for i, stream in enumerate(camera_stream_info):
+            width = stream.width
+            if width == 0:
                 break
+            height = stream.height
+            fmt = stream.format
             
             res_info = {
                 'index': i,
-                'width': camera_stream_info[i].width,
-                'height': camera_stream_info[i].height,
-                'format': camera_stream_info[i].format.decode() if camera_stream_info[i].format else 'Unknown'
+                'width': width,
+                'height': height,
+                'format': fmt.decode() if fmt else 'Unknown'
             }
             resolutions.append(res_info)
-            
-            # 选择目标分辨率
-            if (camera_stream_info[i].width == 256 and 
-                camera_stream_info[i].height == target_height):
-                stream_idx = i
+            stream_index[(width, height)] = i
         
+        # 选择目标分辨率
+        stream_idx = stream_index.get((256, target_height), -1)
         if stream_idx < 0:
             raise RuntimeError(f"未找到 256x{target_height} 分辨率")
         
         # 打开相机
-        ret = self.libiruvc.uvc_camera_open(devs_cfg[found_dev_index])
+        ret = self.libiruvc.uvc_camera_open(dev_cfg)
         if ret < 0:
             raise RuntimeError(f"打开相机失败 (ret={ret})")
         
         # 设置相机参数
+        stream = camera_stream_info[stream_idx]
+        width = stream.width
+        height = stream.height
         self.camera_param = CameraParam()
-        self.camera_param.dev_cfg = devs_cfg[found_dev_index]
-        self.camera_param.format = camera_stream_info[stream_idx].format
-        self.camera_param.width = camera_stream_info[stream_idx].width
-        self.camera_param.height = camera_stream_info[stream_idx].height
-        self.camera_param.frame_size = (
-            camera_stream_info[stream_idx].width * 
-            camera_stream_info[stream_idx].height * 2
-        )
+        self.camera_param.dev_cfg = dev_cfg
+        self.camera_param.format = stream.format
+        self.camera_param.width = width
+        self.camera_param.height = height
+        self.camera_param.frame_size = width * height * 2
         self.camera_param.fps = DEFAULT_FPS
         self.camera_param.timeout_ms_delay = DEFAULT_TIMEOUT
         
@@ -386,10 +437,17 @@ class ThermalCameraSDK:
             'use_384_mode': use_384_mode
         }
     
-    def start_stream(self):
+    def start_stream(self, background=False, celsius=True):
         """
         启动视频流
         
+        参数:
+            background: 是否启用后台采集线程（默认 False）。启用后取帧与解码在
+                        后台进行，get_frame 直接返回最新一帧，不再阻塞在 USB 传输上
+            celsius: 是否每帧生成整幅摄氏度数组（默认 True）。只需要统计值和个别
+                     像素温度时可设为 False，此时 temperature_celsius 为 None，
+                     可用 temp_value_converter 换算单个原始值
+        
         返回:
             bool: 成功返回 True
         """
@@ -404,31 +462,308 @@ class ThermalCameraSDK:
         if ret < 0:
             raise RuntimeError(f"启动视频流失败 (ret={ret})")
         
-        # 分配缓冲区
-        self.frame_buffer = (c_uint8 * self.frame_size)()
+        self._convert_celsius = celsius
+        
+        # 缓存热路径上的函数引用，避免每帧在 CDLL 对象上查找属性
+        self._uvc_frame_get = self.libiruvc.uvc_frame_get
+        self._raw_data_cut = self.libirparse.raw_data_cut
         
-        if self.height == 384:  # 组合模式
-            self.image_buffer = (c_uint8 * self.image_byte_size)()
-            self.temp_buffer = (c_uint8 * self.temp_byte_size)()
+        # 分配缓冲区（同步模式使用的帧槽位）
+        slot = self._acquire_frame_slot()
+        self._sync_slot = slot
+        self.frame_buffer = slot['frame']
+        self.image_buffer = slot['image_buffer']
+        self.temp_buffer = slot['temp_buffer']
+        self._temp_view = slot['temp']
+        self._image_view = slot['image']
+        self._celsius_buf = slot['celsius']
         
         self.is_streaming = True
         self.frame_count = 0
         
+        if background:
+            self._start_capture_thread()
+        
+        return True
+    
+    @staticmethod
+    def _as_ndarray(cbuf, dtype, shape):
+        """
+        在 ctypes 缓冲区上建立只读 NumPy 视图（零拷贝）
+        
+        ctypes 数组本身支持缓冲区协议，不需要逐元素读取再构造数组。
+        视图直接指向相机写入的内存，调用方只能读取，需要保留请 copy()
+        
+        参数:
+            cbuf: ctypes 缓冲区
+            dtype: 元素类型
+            shape: 数组形状
+        
+        返回:
+            numpy.ndarray: 只读视图
+        """
+        arr = np.frombuffer(cbuf, dtype=dtype).reshape(shape)
+        arr.setflags(write=False)
+        return arr
+    
+    @staticmethod
+    def _alloc_aligned(size):
+        """
+        分配按内存页对齐的 ctypes 缓冲区
+        
+        多分配一页，再从第一个页边界处取出 size 字节；返回的数组持有原始
+        缓冲区的引用，不会被提前回收
+        
+        参数:
+            size: 字节数
+        
+        返回:
+            ctypes 数组 (c_uint8 * size)
+        """
+        raw = (c_uint8 * (size + mmap.PAGESIZE))()
+        offset = -addressof(raw) % mmap.PAGESIZE
+        return (c_uint8 * size).from_buffer(raw, offset)
+    
+    def _frame_slot_key(self):
+        """帧槽位池的键：槽位布局只取决于帧尺寸和分离 / 转换模式"""
+        return (self.width, self.height, self.image_byte_size, self.temp_byte_size,
+                self._use_dll_cut, self._convert_celsius)
+    
+    def _acquire_frame_slot(self):
+        """从槽位池取出一个匹配当前配置的帧槽位，没有则新分配"""
+        pool = self._slot_pool.get(self._frame_slot_key())
+        if pool:
+            return pool.pop()
+        return self._alloc_frame_slot()
+    
+    def _release_frame_slots(self, slots):
+        """把帧槽位归还到槽位池"""
+        for slot in slots:
+            slot['data'] = None
+            self._slot_pool.setdefault(slot['key'], []).append(slot)
+    
+    def _alloc_frame_slot(self):
+        """
+        分配一个帧槽位：UVC 帧缓冲区（按页对齐），以及在其上建立一次、
+        之后每帧复用的 NumPy 视图
+        
+        返回:
+            dict: frame / image_buffer / temp_buffer 为 ctypes 缓冲区，
+                  frame_ptr / image_ptr / temp_ptr 为 raw_data_cut 使用的预转换指针
+                  （仅 DLL 分离模式），
+                  temp / image 为 uint16 只读视图，celsius 为 float32 输出缓冲区，
+                  key 为槽位池的键
+        """
+        frame_buffer = self._alloc_aligned(self.frame_size)
+        frame_ptr = image_ptr = temp_ptr = None
+        image_buffer = None
+        temp_buffer = None
+        
+        temp_shape = (self.temp_height, self.temp_width)
+        full_view = self._as_ndarray(frame_buffer, np.uint16, (self.height, self.width))
+        
+        if self.height == 384 and self._use_dll_cut:  # 组合模式 - 由 raw_data_cut 分离
+            image_buffer = self._alloc_aligned(self.image_byte_size)
+            temp_buffer = self._alloc_aligned(self.temp_byte_size)
+            # 指针转换只做一次，避免每帧在持有 GIL 时调用 cast() 分配新对象
+            frame_ptr = cast(frame_buffer, POINTER(c_uint8))
+            image_ptr = cast(image_buffer, POINTER(c_uint8))
+            temp_ptr = cast(temp_buffer, POINTER(c_uint8))
+            temp_view = self._as_ndarray(temp_buffer, np.uint16, temp_shape)
+            image_view = self._as_ndarray(image_buffer, np.uint16, temp_shape)
+        elif self.height == 384:  # 组合模式 - 上半帧为图像，下半帧为温度
+            image_view = full_view[:self.temp_height]
+            temp_view = full_view[self.temp_height:]
+        else:
+            temp_view = full_view
+            image_view = None
+        
+        return {
+            'key': self._frame_slot_key(),
+            'frame': frame_buffer,
+            'frame_ptr': frame_ptr,
+            'image_ptr': image_ptr,
+            'temp_ptr': temp_ptr,
+            'image_buffer': image_buffer,
+            'temp_buffer': temp_buffer,
+            'temp': temp_view,
+            'image': image_view,
+            'celsius': np.empty(temp_shape, dtype=np.float32) if self._convert_celsius else None,
+            'data': None,
+        }
+    
+    def _start_capture_thread(self):
+        """分配帧槽位并启动后台采集线程"""
+        # 三个槽位各有独立的 UVC 帧缓冲区，USB 直接写入后台槽位，无需再拷贝；
+        # 第一个槽位复用同步模式的缓冲区
+        self._slots = [self._sync_slot, self._acquire_frame_slot(), self._acquire_frame_slot()]
+        self._back, self._ready, self._front = 0, 1, 2
+        self._stop_event.clear()
+        self._frame_ready.clear()
+        self._capture_error = None
+        
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+    
+    def _grab_frame(self, slot, max_retries):
+        """
+        从相机读取一帧原始数据到帧槽位的缓冲区，并完成数据分离
+        
+        参数:
+            slot: _alloc_frame_slot 分配的帧槽位
+            max_retries: 最大重试次数
+        
+        返回:
+            bool: 成功返回 True
+        """
+        # 获取原始帧（帧未就绪时短暂退避后重试，退避时间逐次增加，最长 5 ms，避免空转占满 CPU）
+        for attempt in range(max_retries):
+            if attempt:
+                time.sleep(0.001 * min(attempt, 5))
+            ret = self._uvc_frame_get(slot['frame'])
+            if ret == 0:
+                break
+        else:
+            return False
+        
+        self.frame_count += 1
+        
+        # 根据模式处理数据（默认 384 模式的分离已由 start_stream 中的切片视图完成）
+        if self.height == 384 and self._use_dll_cut:  # 组合模式 - 需要分离
+            # 调用 raw_data_cut 分离数据
+            ret_cut = self._raw_data_cut(
+                slot['frame_ptr'],
+                self.image_byte_size,
+                self.temp_byte_size,
+                slot['image_ptr'],
+                slot['temp_ptr']
+            )
+            
+            if ret_cut != 0:
+                return False
+        
         return True
     
-    def get_frame(self, max_retries=10):
+    def _decode_frame(self, temp_raw, image_raw, celsius_buf):
+        """
+        温度转换并计算统计信息，生成 get_frame 返回的帧数据
+        
+        参数:
+            temp_raw: 温度原始数据（uint16）
+            image_raw: 图像原始数据（uint16，仅 384 模式，否则为 None）
+            celsius_buf: 摄氏度输出缓冲区（float32，与 temp_raw 同尺寸；
+                         start_stream(celsius=False) 时为 None，不做转换）
+        
+        返回:
+            dict: 帧数据，格式见 get_frame
+        """
+        # 转换为摄氏度（写入预分配缓冲区）
+        if celsius_buf is not None:
+            temp_celsius = temp_array_converter(temp_raw, out=celsius_buf)
+        else:
+            temp_celsius = None
+        
+        # 计算统计信息：只在 uint16 原始数据上归约一次，
+        # 摄氏度是线性变换，最小值/最大值/平均值直接由原始值换算，无需再扫描 float32 数组
+        raw_min = int(temp_raw.min())
+        raw_max = int(temp_raw.max())
+        raw_avg = float(temp_raw.sum(dtype=np.uint64)) / temp_raw.size
+        
+        temp_min = raw_min * TEMP_SCALE - TEMP_OFFSET
+        temp_max = raw_max * TEMP_SCALE - TEMP_OFFSET
+        temp_avg = raw_avg * TEMP_SCALE - TEMP_OFFSET
+        
+        return {
+            'frame_number': self.frame_count,
+            'raw_frame': temp_raw,
+            'temperature_raw': temp_raw,
+            'temperature_celsius': temp_celsius,
+            'image_raw': image_raw,
+            'stats': {
+                'raw_min': raw_min,
+                'raw_max': raw_max,
+                'raw_avg': raw_avg,
+                'temp_min': temp_min,
+                'temp_max': temp_max,
+                'temp_avg': temp_avg,
+            }
+        }
+    
+    def _capture_loop(self):
+        """
+        后台采集线程
+        
+        阻塞在 uvc_frame_get 上（ctypes 调用期间释放 GIL），帧直接写入后台槽位
+        的缓冲区，完成温度转换与统计后与就绪槽位交换。
+        锁覆盖槽位交换和通知（不覆盖取帧与解码），保证调用方看到的通知与就绪槽位
+        一致，调用方正在使用的前台槽位永远不会被写入。
+        出错时记录异常并退出线程，之后的 get_frame 会抛出该错误
+        """
+        try:
+            while not self._stop_event.is_set():
+                slot = self._slots[self._back]
+                if not self._grab_frame(slot, max_retries=10):
+                    continue
+                
+                slot['data'] = self._decode_frame(slot['temp'], slot['image'], slot['celsius'])
+                
+                with self._slot_lock:
+                    self._back, self._ready = self._ready, self._back
+                    self._frame_ready.set()
+        except Exception as e:
+            print(f"\n✗ 后台采集线程出错: {e}")
+            import traceback
+            traceback.print_exc()
+            with self._slot_lock:
+                self._capture_error = e
+                self._frame_ready.set()  # 唤醒正在等待的 get_frame
+    
+    def _latest_frame(self, timeout):
+        """
+        取出后台线程发布的最新一帧
+        
+        参数:
+            timeout: 等待新帧的超时时间（秒）
+        
+        返回:
+            dict 或 None: 帧数据，超时返回 None
+        
+        异常:
+            RuntimeError: 后台采集线程已因错误退出
+        """
+        if not self._frame_ready.wait(timeout):
+            return None
+        
+        with self._slot_lock:
+            if self._capture_error is not None:
+                raise RuntimeError(f"后台采集线程已停止: {self._capture_error}") from self._capture_error
+            self._frame_ready.clear()
+            self._front, self._ready = self._ready, self._front
+        
+        return self._slots[self._front]['data']
+    
+    def get_frame(self, max_retries=10, copy=False):
         """
         获取一帧数据（包含温度数据分离）
         
+        注意：默认返回的 raw_frame / temperature_raw / image_raw 是直接指向
+        USB 帧缓冲区的只读视图，temperature_celsius 也是复用的内部缓冲区，
+        之后的 get_frame 调用会覆盖其内容；录像等需要保留数据的场景请传入 copy=True
+        
+        后台采集模式（start_stream(background=True)）下直接返回后台线程
+        解码好的最新一帧，最长等待 timeout_ms_delay 毫秒，不再使用 max_retries
+        
         参数:
             max_retries: 最大重试次数（默认 10）
+            copy: 是否返回独立的数组副本（默认 False，返回零拷贝视图）
         
         返回:
             dict 或 None: {
                 'frame_number': 帧号,
                 'raw_frame': 原始数据（uint16 numpy array），
                 'temperature_raw': 温度原始数据（uint16 numpy array），
-                'temperature_celsius': 温度数据（摄氏度，float32 numpy array），
+                'temperature_celsius': 温度数据（摄氏度，float32 numpy array；
+                                        start_stream(celsius=False) 时为 None），
                 'image_raw': 图像原始数据（uint16 numpy array，仅 384 模式），
                 'stats': {
                     'raw_min': 原始最小值,
@@ -439,99 +774,61 @@ class ThermalCameraSDK:
                     'temp_avg': 温度平均值（°C）,
                 }
             }
+        
+        异常:
+            RuntimeError: 视频流未启动，或后台采集线程已因错误退出
         """
         if not self.is_streaming:
             raise RuntimeError("视频流未启动，请先调用 start_stream()")
         
-        # 获取原始帧
-        retry_count = 0
-        while retry_count < max_retries:
-            ret = self.libiruvc.uvc_frame_get(self.frame_buffer)
-            if ret == 0:
-                break
-            retry_count += 1
-        
-        if retry_count >= max_retries:
+        if self._capture_thread is not None:
+            data = self._latest_frame(self.camera_param.timeout_ms_delay / 1000.0)
+        elif self._grab_frame(self._sync_slot, max_retries):
+            # 温度 / 图像数据直接使用 start_stream 中建立的视图（零拷贝）
+            data = self._decode_frame(self._temp_view, self._image_view, self._celsius_buf)
+        else:
             return None
         
-        self.frame_count += 1
-        
-        # 根据模式处理数据
-        if self.height == 384:  # 组合模式 - 需要分离
-            # 调用 raw_data_cut 分离数据
-            ret_cut = self.libirparse.raw_data_cut(
-                cast(self.frame_buffer, POINTER(c_uint8)),
-                self.image_byte_size,
-                self.temp_byte_size,
-                self.image_buffer,
-                self.temp_buffer
+        if copy and data is not None:
+            temp_raw = data['temperature_raw'].copy()
+            image_raw = data['image_raw']
+            temp_celsius = data['temperature_celsius']
+            data = dict(
+                data,
+                raw_frame=temp_raw,
+                temperature_raw=temp_raw,
+                temperature_celsius=temp_celsius.copy() if temp_celsius is not None else None,
+                image_raw=image_raw.copy() if image_raw is not None else None,
+                stats=dict(data['stats']),
             )
-            
-            if ret_cut != 0:
-                return None
-            
-            # 转换温度缓冲区为 NumPy 数组
-            temp_ptr = cast(self.temp_buffer, POINTER(c_uint16))
-            temp_pixel_count = self.temp_width * self.temp_height
-            temp_raw = np.array(
-                [temp_ptr[i] for i in range(temp_pixel_count)], 
-                dtype=np.uint16
-            ).reshape((self.temp_height, self.temp_width))
-            
-            # 转换图像缓冲区为 NumPy 数组
-            image_ptr = cast(self.image_buffer, POINTER(c_uint16))
-            image_pixel_count = self.temp_width * self.temp_height
-            image_raw = np.array(
-                [image_ptr[i] for i in range(image_pixel_count)], 
-                dtype=np.uint16
-            ).reshape((self.temp_height, self.temp_width))
-            
-        else:  # 192 模式 - 直接使用
-            temp_ptr = cast(self.frame_buffer, POINTER(c_uint16))
-            temp_pixel_count = self.width * self.height
-            temp_raw = np.array(
-                [temp_ptr[i] for i in range(temp_pixel_count)], 
-                dtype=np.uint16
-            ).reshape((self.height, self.width))
-            image_raw = None
-        
-        # 转换为摄氏度
-        temp_celsius = temp_array_converter(temp_raw)
-        
-        # 计算统计信息
-        raw_min = np.min(temp_raw)
-        raw_max = np.max(temp_raw)
-        raw_avg = np.mean(temp_raw)
-        
-        temp_min = np.min(temp_celsius)
-        temp_max = np.max(temp_celsius)
-        temp_avg = np.mean(temp_celsius)
         
-        return {
-            'frame_number': self.frame_count,
-            'raw_frame': temp_raw,
-            'temperature_raw': temp_raw,
-            'temperature_celsius': temp_celsius,
-            'image_raw': image_raw,
-            'stats': {
-                'raw_min': int(raw_min),
-                'raw_max': int(raw_max),
-                'raw_avg': float(raw_avg),
-                'temp_min': float(temp_min),
-                'temp_max': float(temp_max),
-                'temp_avg': float(temp_avg),
-            }
-        }
+        return data
     
     def stop_stream(self):
         """停止视频流"""
         if not self.is_streaming:
             return
         
+        # 先停止后台采集线程，再关闭视频流和释放缓冲区
+        if self._capture_thread is not None:
+            self._stop_event.set()
+            self._capture_thread.join()
+            self._capture_thread = None
+            self._release_frame_slots(self._slots)
+            self._slots = None
+        else:
+            self._release_frame_slots([self._sync_slot])
+        
         self.libiruvc.uvc_camera_stream_close(1)
         self.is_streaming = False
         
-        # 释放缓冲区
+        # 缓冲区已归还到槽位池，这里只清除引用
+        self._uvc_frame_get = None
+        self._raw_data_cut = None
+        self._sync_slot = None
+        self._temp_view = None
+        self._image_view = None
+        self._celsius_buf = None
         self.frame_buffer = None
         self.image_buffer = None
         self.temp_buffer = None
@@ -558,6 +855,9 @@ class ThermalCameraSDK:
         if self.is_initialized:
             self.libiruvc.uvc_camera_release()
             self.is_initialized = False
+        
+        # 释放槽位池中缓存的缓冲区
+        self._slot_pool.clear()
     
     def get_camera_info(self):
         """获取当前相机信息"""
@@ -8,11 +8,28 @@
 日期：2025-11-10
 """
 
+import os
 import sys
 import time
 import cv2
 import numpy as np
-from thermal_camera_sdk import ThermalCameraSDK
+from thermal_camera_sdk import ThermalCameraSDK, temp_value_converter
+
+
+# 终端状态行输出间隔（帧）
+STATUS_INTERVAL = 10
+
+# 显示放大倍数（256x192 -> 768x576）
+DISPLAY_SCALE = 3
+
+# 设置环境变量 THERMAL_USE_OPENCL=1 时，伪彩色和放大走 OpenCL (UMat) 路径。
+# 默认关闭：预分配的 CPU 路径已足够快，仅有 CPU OpenCL 运行时的机器上
+# UMat 路径反而每帧都要分配并下载整幅显示图像
+USE_OPENCL = os.environ.get("THERMAL_USE_OPENCL", "0") == "1"
+
+# 信息面板区域（与原 cv2.rectangle((5, 5), (280, 240)) 一致，含端点）
+PANEL_X0, PANEL_Y0 = 5, 5
+PANEL_X1, PANEL_Y1 = 280, 240
 
 
 def main():
@@ -48,7 +65,8 @@ def main():
         
         # 4. 启动视频流
         print("\n4. 启动视频流...")
-        sdk.start_stream()
+        # 后台线程取帧，显示与 USB 传输并行；显示只用原始数据，不生成整幅摄氏度数组
+        sdk.start_stream(background=True, celsius=False)
         print("   ✓ 视频流启动成功")
         
         # 5. 实时显示
@@ -64,6 +82,19 @@ def main():
         
         start_time = time.time()
         frame_count = 0
+        gray = None
+        
+        # JET 伪彩色查找表 (256x3 BGR) 及其水平放大版本 (256x(3*DISPLAY_SCALE))
+        lut = cv2.applyColorMap(
+            np.arange(256, dtype=np.uint8).reshape(1, 256), cv2.COLORMAP_JET).reshape(256, 3)
+        lut_wide = np.ascontiguousarray(np.tile(lut, (1, DISPLAY_SCALE)))
+        
+        # 显式开启且有 OpenCL 设备时，伪彩色和放大走 UMat（GPU）路径
+        use_opencl = USE_OPENCL and cv2.ocl.haveOpenCL()
+        
+        # 终端状态行格式（每 STATUS_INTERVAL 帧输出一次）
+        status_fmt = ("\r帧 {:4d} | 温度: {:5.1f} - {:5.1f}°C | "
+                      "平均: {:5.1f}°C | 中心: {:5.1f}°C | FPS: {:5.1f}")
         
         try:
             while True:
@@ -78,7 +109,7 @@ def main():
                 frame_count += 1
                 
                 # 提取温度数据
-                temp_celsius = frame_data['temperature_celsius']
+                temp_raw = frame_data['temperature_raw']
                 stats = frame_data['stats']
                 
                 # 只在第一帧打印详细信息
@@ -94,24 +125,35 @@ def main():
                         print(f"  ⚠️  温度数据可能异常")
                     print()
                 
-                # 获取中心点温度
-                height, width = temp_celsius.shape
-                center_temp = temp_celsius[height // 2, width // 2]
-                
-                # 归一化显示
-                min_temp = stats['temp_min']
-                max_temp = stats['temp_max']
-                normalized = np.clip(
-                    (temp_celsius - min_temp) / (max_temp - min_temp + 1e-6),
-                    0, 1
-                )
-                gray = (normalized * 255).astype(np.uint8)
-                
-                # 应用伪彩色
-                colored = cv2.applyColorMap(gray, cv2.COLORMAP_JET)
-                
-                # 放大显示
-                display = cv2.resize(colored, (768, 576), interpolation=cv2.INTER_NEAREST)
+                # 获取中心点温度（只换算这一个像素）
+                height, width = temp_raw.shape
+                center_temp = temp_value_converter(temp_raw[height // 2, width // 2])
+                
+                # 归一化显示：摄氏度是原始值的线性变换，直接按原始值的最小/最大值
+                # 归一化，一次遍历 uint16 数据完成 缩放 + 饱和 + 转 uint8，不经过 float 数组
+                # 温度范围为 0（画面均匀）时分母取 1，整幅画面为 0，与原 float 路径一致
+                raw_min = stats['raw_min']
+                scale = 255.0 / max(1, stats['raw_max'] - raw_min)
+                if gray is None or gray.shape != temp_raw.shape:
+                    gray = np.empty(temp_raw.shape, dtype=np.uint8)
+                    colored_wide = np.empty((height, width * DISPLAY_SCALE * 3), dtype=np.uint8)
+                    display_buf = np.empty((height * DISPLAY_SCALE, width * DISPLAY_SCALE, 3),
+                                           dtype=np.uint8)
+                cv2.convertScaleAbs(temp_raw, gray, scale, -raw_min * scale)
+                
+                # 应用伪彩色并放大显示
+                if use_opencl:
+                    colored = cv2.applyColorMap(cv2.UMat(gray), cv2.COLORMAP_JET)
+                    display = cv2.resize(colored, (768, 576), interpolation=cv2.INTER_NEAREST).get()
+                else:
+                    # 最近邻放大只是把每个像素复制成 3x3 块：
+                    # 查表时直接取出水平重复 3 次的颜色，得到放大后的一行；
+                    # 再把每行整行复制 3 次（连续内存拷贝）写入预分配的显示缓冲区
+                    np.take(lut_wide, gray, axis=0,
+                            out=colored_wide.reshape(height, width, DISPLAY_SCALE * 3), mode='clip')
+                    np.copyto(display_buf.reshape(height, DISPLAY_SCALE, width * DISPLAY_SCALE * 3),
+                              colored_wide[:, None, :])
+                    display = display_buf
                 
                 # 添加十字准星
                 center_x, center_y = 768 // 2, 576 // 2
@@ -142,10 +184,10 @@ def main():
                     f"  Center: {center_temp:.1f} C",
                 ]
                 
-                # 绘制半透明背景
-                overlay = display.copy()
-                cv2.rectangle(overlay, (5, 5), (280, 240), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, display, 0.3, 0, display)
+                # 绘制半透明背景：黑色以 0.7 混合等价于面板区域亮度乘 0.3，
+                # 只处理面板区域，不再复制和混合整幅图像
+                panel = display[PANEL_Y0:PANEL_Y1 + 1, PANEL_X0:PANEL_X1 + 1]
+                cv2.convertScaleAbs(panel, panel, 0.3)
                 
                 # 绘制文本
                 y_pos = 25
@@ -157,12 +199,12 @@ def main():
                 # 显示
                 cv2.imshow(window_name, display)
                 
-                # 终端输出
-                print(f"\r帧 {frame_count:4d} | "
-                      f"温度: {stats['temp_min']:5.1f} - {stats['temp_max']:5.1f}°C | "
-                      f"平均: {stats['temp_avg']:5.1f}°C | "
-                      f"中心: {center_temp:5.1f}°C | "
-                      f"FPS: {fps:5.1f}", end="", flush=True)
+                # 终端输出（节流，避免每帧刷新终端拖慢显示循环）
+                if frame_count % STATUS_INTERVAL == 0:
+                    sys.stdout.write(status_fmt.format(
+                        frame_count, stats['temp_min'], stats['temp_max'],
+                        stats['temp_avg'], center_temp, fps))
+                    sys.stdout.flush()
                 
                 # 检查按键
                 key = cv2.waitKey(1) & 0xFF